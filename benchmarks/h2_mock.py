@@ -0,0 +1,166 @@
+"""
+Local BingX mock for comparing the default HTTP/1.1 transport with the HTTP/2 one.
+
+The mock answers every request with a small JSON body after a fixed server-side delay.
+It speaks HTTP/1.1 and cleartext HTTP/2 (prior knowledge) on the same port.
+
+    pip install -e .[http2]
+    python benchmarks/h2_mock.py --requests 200 --concurrency 32 --delay-ms 5
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h11
+import h2.config
+import h2.connection
+import h2.events
+
+from pybingx import AsyncBingXClient, BingXClient
+
+H2_PREFACE = b"PRI * HTTP/2.0"
+BODY = json.dumps({"code": 0, "msg": "", "data": [{"time": 0, "isBuyerMaker": True, "price": "1", "qty": "1", "quoteQty": "1"}]}).encode()
+
+
+class MockServer:
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+        threading.Thread(target=self._run, args=(started,), daemon=True).start()
+        started.wait()
+
+
+    def _run(self, started):
+        asyncio.set_event_loop(self.loop)
+        self.server = self.loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0))
+        self.url = "http://127.0.0.1:%d" % self.server.sockets[0].getsockname()[1]
+        started.set()
+        self.loop.run_forever()
+
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        data = await reader.read(65536)
+        try:
+            if data.startswith(H2_PREFACE):
+                await self._serve_h2(reader, writer, data)
+            else:
+                await self._serve_h1(reader, writer, data)
+        except (ConnectionError, h11.ProtocolError):
+            pass
+        finally:
+            writer.close()
+
+
+    async def _serve_h1(self, reader, writer, data):
+        conn = h11.Connection(h11.SERVER)
+        conn.receive_data(data)
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                conn.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.EndOfMessage):
+                self.requests += 1
+                await asyncio.sleep(self.delay)
+                headers = [("content-type", "application/json"), ("content-length", str(len(BODY)))]
+                writer.write(conn.send(h11.Response(status_code=200, headers=headers)))
+                writer.write(conn.send(h11.Data(data=BODY)))
+                writer.write(conn.send(h11.EndOfMessage()))
+                await writer.drain()
+                if conn.our_state is not h11.DONE or conn.their_state is not h11.DONE:
+                    return
+                conn.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                return
+
+
+    async def _serve_h2(self, reader, writer, data):
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    self.requests += 1
+                    asyncio.ensure_future(self._respond_h2(conn, writer, event.stream_id))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+
+
+    async def _respond_h2(self, conn, writer, stream_id):
+        await asyncio.sleep(self.delay)
+        headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(BODY)))]
+        conn.send_headers(stream_id, headers)
+        conn.send_data(stream_id, BODY, end_stream=True)
+        writer.write(conn.data_to_send())
+
+
+def mock_client_class(base, url):
+    class MockClient(base):
+        API_URL = url
+
+        def _new_session(self, session_cls):
+            # The mock has no TLS, so skip ALPN and speak HTTP/2 directly.
+            return session_cls(http1=False, http2=True, **self._session_options())
+
+    return MockClient
+
+
+def run_sync(client, n, concurrency):
+    with ThreadPoolExecutor(concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(lambda _: client.get_trades("BTC-USDT"), range(n)))
+        return time.perf_counter() - start
+
+
+async def run_async(client, n, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await client.get_trades("BTC-USDT")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    server = MockServer(args.delay_ms / 1000)
+
+    def report(name, elapsed, connections):
+        print(f"{name:<24} {elapsed * 1000:8.1f} ms total  {elapsed * 1e6 / args.requests:8.1f} us/request  {connections} connections")
+
+    before = server.connections
+    client = mock_client_class(BingXClient, server.url)("key", "secret")
+    report("HTTP/1.1 (requests)", run_sync(client, args.requests, args.concurrency), server.connections - before)
+
+    before = server.connections
+    with mock_client_class(BingXClient, server.url)("key", "secret", http2=True) as client:
+        report("HTTP/2 sync", run_sync(client, args.requests, args.concurrency), server.connections - before)
+
+    async def run_h2_async():
+        async with mock_client_class(AsyncBingXClient, server.url)("key", "secret") as client:
+            return await run_async(client, args.requests, args.concurrency)
+
+    before = server.connections
+    report("HTTP/2 async", asyncio.run(run_h2_async()), server.connections - before)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,4 @@
 
-from .client import BingXClient
\ No newline at end of file
+from .client import BingXClient
+from .async_client import AsyncBingXClient
+from .tape import TradePoller, TradeRing
\ No newline at end of file
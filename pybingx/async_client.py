@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+from .client import BingXClient, _require_httpx, logger
+
+
+class AsyncBingXClient(BingXClient):
+    """
+    Asyncio variant of BingXClient. Every endpoint method returns an awaitable, and all
+    requests are multiplexed over a single HTTP/2 connection.
+
+    Use it as an async context manager so the connection is pre-warmed on entry:
+
+        async with AsyncBingXClient(api_key, secret_key) as client:
+            trades, depth = await asyncio.gather(client.get_trades("BTC-USDT"), client.get_depth("BTC-USDT"))
+    """
+
+
+    def __init__(self, api_key: str, secret_key: str, keepalive_interval: float = 30.0):
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.keepalive_interval = keepalive_interval
+        self._http2 = True
+        self._last_request = time.monotonic()
+        self._session = self._new_session(_require_httpx().AsyncClient)
+        self._keepalive_task = None
+
+
+    def __enter__(self):
+        raise TypeError("AsyncBingXClient must be used with 'async with', not 'with'")
+
+
+    def __exit__(self, *exc):
+        raise TypeError("AsyncBingXClient must be used with 'async with', not 'with'")
+
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+    async def connect(self):
+        """
+        Pre-warm DNS, TCP and TLS, then start the keep-alive pings.
+        """
+        await self._warm_up()
+        if self.keepalive_interval and self._keepalive_task is None:
+            self._start_keepalive(self.keepalive_interval)
+
+
+    async def close(self):
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        session, self._session = self._session, None
+        if session is not None:
+            await session.aclose()
+
+
+    async def _warm_up(self):
+        httpx = _require_httpx()
+        try:
+            await self.get_server_time()
+        except (httpx.HTTPError, ValueError):
+            pass
+
+
+    def _start_keepalive(self, interval: float):
+        self._keepalive_task = asyncio.ensure_future(self._keepalive(interval))
+
+
+    async def _keepalive(self, interval: float):
+        # Ping only once the connection has been idle for `interval` seconds.
+        delay = interval
+        while True:
+            await asyncio.sleep(delay)
+            if self._idle_time() >= interval:
+                try:
+                    await self.get_server_time()
+                except Exception:
+                    logger.warning("Keep-alive ping failed", exc_info=True)
+            delay = max(interval - self._idle_time(), 0.0)
+
+
+    async def _send_request(self, method: str, path: str, params: dict, return_binary: bool = False):
+        url, headers, body = self._prepare_request(method, path, params)
+        response = await self._get_session().request(method, url, headers=headers, json=body)
+        if return_binary:
+            return response.content  # Return binary content for file downloads
+        return response.json()
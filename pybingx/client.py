@@ -3,6 +3,16 @@ import requests
 import hmac
 from hashlib import sha256
 import json
+import logging
+import threading
+import weakref
+
+try:
+    import httpx
+except ImportError:  # optional, only needed for the HTTP/2 transport
+    httpx = None
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -17,9 +27,88 @@ class BingXClient:
     API_URL = "https://open-api.bingx.com"
 
 
-    def __init__(self, api_key: str, secret_key: str):
+    def __init__(self, api_key: str, secret_key: str, http2: bool = False, keepalive_interval: float = 30.0):
+        """
+        :param api_key: The BingX API key.
+        :param secret_key: The BingX secret key used to sign requests.
+        :param http2: Send requests over one multiplexed HTTP/2 connection (requires `pip install pybingx[http2]`).
+        :param keepalive_interval: Seconds between keep-alive pings on the HTTP/2 connection (0 disables them).
+        """
         self.api_key = api_key
         self.secret_key = secret_key
+        self.keepalive_interval = keepalive_interval
+        self._http2 = http2
+        self._last_request = time.monotonic()
+        self._session = None
+        self._keepalive_stop = None
+        self._keepalive_thread = None
+        if http2:
+            self._session = self._new_session(_require_httpx().Client)
+            self._warm_up()
+            if keepalive_interval:
+                self._start_keepalive(keepalive_interval)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+    def close(self):
+        """
+        Stop the keep-alive pings and close the HTTP/2 connection, if any.
+        """
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            self._keepalive_stop = None
+        thread, self._keepalive_thread = self._keepalive_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+    def _new_session(self, session_cls):
+        return session_cls(http2=True, **self._session_options())
+
+
+    def _session_options(self) -> dict:
+        # httpx drops idle connections after 5s by default; keep them well past the ping interval.
+        expiry = 2 * self.keepalive_interval + 5.0 if self.keepalive_interval else 5.0
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=expiry)
+        return {"timeout": 10.0, "limits": limits}
+
+
+    def _warm_up(self):
+        # Resolve DNS and complete the TCP/TLS/ALPN handshake now rather than on the first order.
+        try:
+            self.get_server_time()
+        except (httpx.HTTPError, ValueError):
+            pass
+
+
+    def _start_keepalive(self, interval: float):
+        stop = threading.Event()
+        # The thread only holds a weak reference, so an unclosed client can still be collected.
+        weakref.finalize(self, stop.set)
+        self._keepalive_stop = stop
+        self._keepalive_thread = threading.Thread(
+            target=_keepalive_loop, args=(weakref.ref(self), stop, interval), name="pybingx-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+
+    def _idle_time(self) -> float:
+        return time.monotonic() - self._last_request
+
+
+    def get_server_time(self) -> dict:
+        path = '/openApi/swap/v2/server/time'
+        return self._send_request("GET", path, {})
 
 
     def get_contracts(self):
@@ -645,6 +734,25 @@ class BingXClient:
 
 
     def _send_request(self, method: str, path: str, params: dict, return_binary: bool = False):
+        url, headers, body = self._prepare_request(method, path, params)
+        if self._http2:
+            response = self._get_session().request(method, url, headers=headers, json=body)
+        else:
+            response = requests.request(method, url, headers=headers, json=body)
+        if return_binary:
+            return response.content  # Return binary content for file downloads
+        return response.json()
+
+
+    def _get_session(self):
+        session = self._session
+        if session is None:
+            raise RuntimeError("The HTTP/2 client has been closed")
+        self._last_request = time.monotonic()
+        return session
+
+
+    def _prepare_request(self, method: str, path: str, params: dict):
         params_str = self._parse_params(params)
         signature = generate_signature(self.secret_key, params_str)
         url = f"{self.API_URL}{path}?{params_str}&signature={signature}"
@@ -653,12 +761,8 @@ class BingXClient:
         }
         if method == "POST":
             headers['Content-Type'] = 'application/json'
-            response = requests.request(method, url, headers=headers, json=params)
-        else:
-            response = requests.request(method, url, headers=headers)
-        if return_binary:
-            return response.content  # Return binary content for file downloads
-        return response.json()
+            return url, headers, params
+        return url, headers, None
 
 
     def _parse_params(self, params: dict) -> str:
@@ -666,3 +770,26 @@ class BingXClient:
         params_str = "&".join([f"{key}={params[key]}" for key in sorted_keys])
         timestamp = f"timestamp={get_timestamp()}"
         return f"{params_str}&{timestamp}" if params_str else timestamp
+
+
+def _keepalive_loop(client_ref, stop: threading.Event, interval: float):
+    # Ping only once the connection has been idle for `interval` seconds.
+    delay = interval
+    while not stop.wait(delay):
+        client = client_ref()
+        if client is None:
+            return
+        if client._idle_time() >= interval:
+            try:
+                client.get_server_time()
+            except Exception:
+                if not stop.is_set():
+                    logger.warning("Keep-alive ping failed", exc_info=True)
+        delay = max(interval - client._idle_time(), 0.0)
+        del client
+
+
+def _require_httpx():
+    if httpx is None:
+        raise ImportError("The HTTP/2 transport requires httpx: pip install pybingx[http2]")
+    return httpx
@@ -0,0 +1,237 @@
+import asyncio
+import inspect
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # optional, only needed for the trade tape
+    np = None
+
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+# 33 bytes per trade instead of a dict of strings.
+TRADE_DTYPE = [("price", "f8"), ("qty", "f8"), ("time", "i8"), ("side", "i1"), ("id", "i8")]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The trade tape requires numpy: pip install pybingx[tape]")
+    return np
+
+
+class TradeRing:
+    """
+    Fixed-capacity, array-backed ring buffer of recent trades for one symbol.
+
+    Trades are stored in a numpy structured array (price, qty, time, side, id) and the
+    oldest trades are overwritten once the buffer is full. Window queries are vectorized
+    and measure time in exchange milliseconds, relative to the newest trade by default.
+    """
+
+
+    def __init__(self, capacity: int = 100000):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self._data = _require_numpy().zeros(capacity, dtype=TRADE_DTYPE)
+        self._head = 0  # next slot to write
+        self._count = 0
+
+
+    def __len__(self):
+        return self._count
+
+
+    @property
+    def last_id(self) -> int:
+        return int(self._data["id"][self._head - 1]) if self._count else -1
+
+
+    @property
+    def last_time(self) -> int:
+        return int(self._data["time"][self._head - 1]) if self._count else 0
+
+
+    def extend(self, trades):
+        """
+        Append a structured array of trades (dtype TRADE_DTYPE) in chronological order.
+        """
+        trades = trades[-self.capacity:]
+        n = len(trades)
+        first = min(n, self.capacity - self._head)
+        self._data[self._head:self._head + first] = trades[:first]
+        self._data[:n - first] = trades[first:]
+        self._head = (self._head + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+
+
+    def to_array(self):
+        """
+        Return a chronological copy of the buffered trades.
+        """
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+
+    def window(self, ms: int, now: int = None):
+        """
+        Return the trades of the last `ms` milliseconds (unordered if the buffer has wrapped).
+
+        :param ms: The window length in milliseconds.
+        :param now: The window end in milliseconds (default: time of the newest trade).
+        """
+        data = self._data[:self._count]
+        now = self.last_time if now is None else now
+        return data[(data["time"] > now - ms) & (data["time"] <= now)]
+
+
+    def volume(self, ms: int, now: int = None) -> float:
+        return float(self.window(ms, now)["qty"].sum())
+
+
+    def buy_sell_volume(self, ms: int, now: int = None):
+        trades = self.window(ms, now)
+        buys = trades["side"] == SIDE_BUY
+        return float(trades["qty"][buys].sum()), float(trades["qty"][~buys].sum())
+
+
+    def imbalance(self, ms: int, now: int = None) -> float:
+        """
+        Return (buy volume - sell volume) / total volume over the window, in [-1, 1].
+        """
+        buy, sell = self.buy_sell_volume(ms, now)
+        total = buy + sell
+        return (buy - sell) / total if total else 0.0
+
+
+    def vwap(self, ms: int, now: int = None) -> float:
+        trades = self.window(ms, now)
+        qty = trades["qty"].sum()
+        return float((trades["price"] * trades["qty"]).sum() / qty) if qty else 0.0
+
+
+class TradePoller:
+    """
+    Feed TradeRing buffers from repeated `get_trades` polls.
+
+    Overlapping responses are merged so each trade is stored once. Trades are matched by
+    their `id` when the response carries one. Otherwise they are ordered by time and
+    matched on (time, price, qty, side), counting repeats, and the ring's `id` column
+    holds a local sequence number. The `limit` of each symbol is tuned after every poll:
+    it doubles when a full response shares no trade with the previous one (trades may
+    have been missed), and halves when most of the response was already seen.
+    """
+
+
+    def __init__(self, client, symbols: list, capacity: int = 100000, limit: int = 100, min_limit: int = 10, max_limit: int = 1000):
+        """
+        :param client: A BingXClient used by `poll`, or an AsyncBingXClient used by `apoll`.
+        :param symbols: The trading pair symbols to track (e.g., ["BTC-USDT"]).
+        :param capacity: The number of trades kept per symbol.
+        :param limit: The initial `get_trades` limit.
+        :param min_limit: The smallest limit the poller will shrink to.
+        :param max_limit: The largest limit the poller will grow to.
+        """
+        self.client = client
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.rings = {symbol: TradeRing(capacity) for symbol in symbols}
+        self.limits = {symbol: limit for symbol in symbols}
+        self.gaps = {symbol: 0 for symbol in symbols}  # polls that may have missed trades
+
+
+    def poll(self, symbol: str) -> int:
+        """
+        Fetch recent trades for `symbol` and merge them into its ring.
+
+        :return: The number of new trades stored.
+        """
+        response = self.client.get_trades(symbol, limit=self.limits[symbol])
+        if inspect.isawaitable(response):
+            response.close()
+            raise TypeError("poll() needs a sync client; use apoll() with AsyncBingXClient")
+        return self._ingest_response(symbol, response)
+
+
+    def poll_all(self) -> dict:
+        return {symbol: self.poll(symbol) for symbol in self.rings}
+
+
+    async def apoll(self, symbol: str) -> int:
+        """
+        Same as `poll`, for an AsyncBingXClient.
+        """
+        response = await self.client.get_trades(symbol, limit=self.limits[symbol])
+        return self._ingest_response(symbol, response)
+
+
+    async def apoll_all(self) -> dict:
+        counts = await asyncio.gather(*(self.apoll(symbol) for symbol in self.rings))
+        return dict(zip(self.rings, counts))
+
+
+    def _ingest_response(self, symbol: str, response: dict) -> int:
+        if response.get("code") != 0:
+            raise RuntimeError(f"get_trades failed for {symbol}: {response.get('code')} {response.get('msg')}")
+        return self.ingest(symbol, response.get("data") or [])
+
+
+    def ingest(self, symbol: str, trades: list) -> int:
+        """
+        Merge a `get_trades` data list into the ring of `symbol` and retune its limit.
+
+        :return: The number of new trades stored.
+        """
+        if not trades:
+            return 0
+        ring = self.rings[symbol]
+        if all("id" in trade for trade in trades):
+            received, new = _new_by_id(ring, trades)
+        else:
+            received, new = _new_by_time(ring, trades)
+        self._tune_limit(symbol, received, len(new), overlapped=len(new) < received or not len(ring))
+        if new:
+            ring.extend(np.array(new, dtype=TRADE_DTYPE))
+        return len(new)
+
+
+    def _tune_limit(self, symbol: str, received: int, new: int, overlapped: bool):
+        limit = self.limits[symbol]
+        if not overlapped and received >= limit:
+            self.gaps[symbol] += 1
+            self.limits[symbol] = min(limit * 2, self.max_limit)
+        elif new * 4 < limit:
+            self.limits[symbol] = max(limit // 2, self.min_limit)
+
+
+def _row(trade: dict, trade_id: int) -> tuple:
+    side = SIDE_SELL if trade["isBuyerMaker"] else SIDE_BUY
+    return float(trade["price"]), float(trade["qty"]), int(trade["time"]), side, trade_id
+
+
+def _new_by_id(ring: TradeRing, trades: list):
+    by_id = {int(trade["id"]): trade for trade in trades}
+    last_id = ring.last_id
+    new = [_row(by_id[trade_id], trade_id) for trade_id in sorted(by_id) if trade_id > last_id]
+    return len(by_id), new
+
+
+def _new_by_time(ring: TradeRing, trades: list):
+    # Without ids, everything before the newest stored millisecond is old, and trades in
+    # that millisecond are new only beyond the copies already stored.
+    rows = sorted((_row(trade, 0) for trade in trades), key=lambda row: row[2])
+    last_time = ring.last_time if len(ring) else None
+    seen = Counter()
+    if last_time is not None:
+        seen.update((price, qty, side) for price, qty, _, side, _ in ring.window(1, last_time).tolist())
+    new = []
+    for price, qty, time, side, _ in rows:
+        if last_time is not None and time < last_time:
+            continue
+        if time == last_time and seen[(price, qty, side)]:
+            seen[(price, qty, side)] -= 1
+            continue
+        new.append((price, qty, time, side, ring.last_id + 1 + len(new)))
+    return len(rows), new
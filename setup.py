@@ -5,6 +5,7 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=["requests"],
+    extras_require={"http2": ["httpx[http2]"], "tape": ["numpy"]},
     description="A Python client for the BingX API",
     author="Ryan Hayabusa",
     author_email="ryu8777@gmail.com",
@@ -0,0 +1,113 @@
+import asyncio
+import gc
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+from h2_mock import MockServer, mock_client_class  # noqa: E402
+
+from pybingx import AsyncBingXClient, BingXClient  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    return MockServer(0.001)
+
+
+def test_warm_up_at_construction(server):
+    with mock_client_class(BingXClient, server.url)("key", "secret", http2=True, keepalive_interval=0):
+        assert server.connections == 1
+        assert server.requests == 1
+
+
+def test_concurrent_requests_share_one_connection(server):
+    with mock_client_class(BingXClient, server.url)("key", "secret", http2=True) as client:
+        with ThreadPoolExecutor(16) as pool:
+            results = list(pool.map(lambda _: client.get_trades("BTC-USDT"), range(64)))
+    assert all(result["code"] == 0 for result in results)
+    assert server.connections == 1
+    assert server.requests == 65
+
+
+def test_keepalive_reuses_connection_across_idle_period(server):
+    # The ping interval is longer than httpx's default 5s keep-alive expiry.
+    with mock_client_class(BingXClient, server.url)("key", "secret", http2=True, keepalive_interval=6) as client:
+        time.sleep(6.5)
+        assert server.requests == 2
+        client.get_trades("BTC-USDT")
+    assert server.connections == 1
+
+
+def test_keepalive_skips_ping_after_recent_request(server):
+    with mock_client_class(BingXClient, server.url)("key", "secret", http2=True, keepalive_interval=0.5) as client:
+        for _ in range(15):
+            client.get_trades("BTC-USDT")
+            time.sleep(0.1)
+    assert server.requests == 16
+
+
+def test_use_after_close_raises(server):
+    client = mock_client_class(BingXClient, server.url)("key", "secret", http2=True, keepalive_interval=0.05)
+    thread = client._keepalive_thread
+    client.close()
+    assert not thread.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.get_trades("BTC-USDT")
+    assert server.connections == 1
+
+
+def test_unclosed_client_stops_keepalive_when_collected(server):
+    client = mock_client_class(BingXClient, server.url)("key", "secret", http2=True, keepalive_interval=0.05)
+    thread = client._keepalive_thread
+    del client
+    gc.collect()
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+def test_failed_ping_keeps_keepalive_running(server):
+    with mock_client_class(BingXClient, server.url)("key", "secret", http2=True, keepalive_interval=0.05) as client:
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise KeyError("boom")
+
+        client.get_server_time = flaky
+        time.sleep(0.3)
+        assert len(calls) > 1
+        assert client._keepalive_thread.is_alive()
+
+
+def test_async_client_rejects_sync_with(server):
+    client = mock_client_class(AsyncBingXClient, server.url)("key", "secret")
+    with pytest.raises(TypeError, match="async with"):
+        with client:
+            pass
+    asyncio.run(client.close())
+
+
+def test_async_client_multiplexes_and_closes(server):
+    async def run():
+        async with mock_client_class(AsyncBingXClient, server.url)("key", "secret", keepalive_interval=0.05) as client:
+            results = await asyncio.gather(*(client.get_trades("BTC-USDT") for _ in range(32)))
+            await asyncio.sleep(0.2)
+            task = client._keepalive_task
+        assert task.done()
+        with pytest.raises(RuntimeError, match="closed"):
+            await client.get_trades("BTC-USDT")
+        return results
+
+    results = asyncio.run(run())
+    assert all(result["code"] == 0 for result in results)
+    assert server.connections == 1
+    assert server.requests > 33
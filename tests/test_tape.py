@@ -0,0 +1,189 @@
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pybingx.tape import SIDE_BUY, SIDE_SELL, TRADE_DTYPE, TradePoller, TradeRing
+
+
+def trade(trade_id, time=None, price="100", qty="1", buyer_maker=False):
+    return {"id": str(trade_id), "time": 1000 + trade_id if time is None else time, "price": price, "qty": qty, "isBuyerMaker": buyer_maker}
+
+
+def trades(ids):
+    return np.array([(100.0, 1.0, 1000 + i, SIDE_BUY, i) for i in ids], dtype=TRADE_DTYPE)
+
+
+def untagged(time, price="100", qty="1", buyer_maker=False):
+    return {"time": time, "price": price, "qty": qty, "quoteQty": "100", "isBuyerMaker": buyer_maker}
+
+
+class FakeClient:
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.limits = []
+
+    def get_trades(self, symbol, limit=10):
+        self.limits.append(limit)
+        return self.responses.pop(0)
+
+
+class FakeAsyncClient(FakeClient):
+
+    async def get_trades(self, symbol, limit=10):
+        return FakeClient.get_trades(self, symbol, limit)
+
+
+def test_trade_is_33_bytes():
+    assert TradeRing(1)._data.itemsize == 33
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_capacity_must_be_positive(capacity):
+    with pytest.raises(ValueError, match="capacity"):
+        TradeRing(capacity)
+
+
+def test_extend_wraps_and_keeps_newest():
+    ring = TradeRing(5)
+    ring.extend(trades(range(3)))
+    ring.extend(trades(range(3, 7)))
+    assert len(ring) == 5
+    assert list(ring.to_array()["id"]) == [2, 3, 4, 5, 6]
+    ring.extend(trades(range(7, 20)))
+    assert list(ring.to_array()["id"]) == [15, 16, 17, 18, 19]
+
+
+def test_last_id_when_head_is_zero():
+    ring = TradeRing(4)
+    assert ring.last_id == -1
+    ring.extend(trades(range(4)))
+    assert ring._head == 0
+    assert ring.last_id == 3
+    assert ring.last_time == 1003
+
+
+def test_window_queries():
+    ring = TradeRing(10)
+    ring.extend(np.array([
+        (100.0, 1.0, 1000, SIDE_BUY, 1),
+        (101.0, 3.0, 1500, SIDE_BUY, 2),
+        (102.0, 1.0, 1900, SIDE_SELL, 3),
+    ], dtype=TRADE_DTYPE))
+    assert ring.volume(500) == 4.0
+    assert ring.buy_sell_volume(1000) == (4.0, 1.0)
+    assert ring.imbalance(500) == pytest.approx(0.5)
+    assert ring.vwap(500) == pytest.approx((101.0 * 3 + 102.0) / 4)
+    assert ring.volume(100, now=1000) == 1.0
+    assert TradeRing(3).imbalance(1000) == 0.0
+
+
+def test_ingest_merges_overlap_by_id():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], capacity=10, limit=4)
+    assert poller.ingest("BTC-USDT", [trade(3), trade(2), trade(1)]) == 3
+    assert poller.ingest("BTC-USDT", [trade(5), trade(4), trade(3)]) == 2
+    ring = poller.rings["BTC-USDT"]
+    assert list(ring.to_array()["id"]) == [1, 2, 3, 4, 5]
+
+
+def test_ingest_collapses_duplicates_within_response():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], capacity=10, limit=4)
+    poller.ingest("BTC-USDT", [trade(11)])
+    assert poller.ingest("BTC-USDT", [trade(12), trade(12), trade(11)]) == 1
+    assert list(poller.rings["BTC-USDT"].to_array()["id"]) == [11, 12]
+
+
+def test_ingest_maps_side():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], capacity=10)
+    poller.ingest("BTC-USDT", [trade(1, buyer_maker=True), trade(2, buyer_maker=False)])
+    assert list(poller.rings["BTC-USDT"].to_array()["side"]) == [SIDE_SELL, SIDE_BUY]
+
+
+def test_ingest_without_id_merges_by_time_and_key():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], capacity=10, limit=4)
+    # Newest first, as returned by get_trades; two identical trades in the same millisecond.
+    assert poller.ingest("BTC-USDT", [untagged(1002), untagged(1002), untagged(1001, price="99")]) == 3
+    assert poller.ingest("BTC-USDT", [untagged(1003, buyer_maker=True), untagged(1002), untagged(1002), untagged(1001, price="99")]) == 1
+    # A third identical trade in the last stored millisecond is new.
+    assert poller.ingest("BTC-USDT", [untagged(1003, buyer_maker=True), untagged(1003, buyer_maker=True)]) == 1
+    trades = poller.rings["BTC-USDT"].to_array()
+    assert list(trades["time"]) == [1001, 1002, 1002, 1003, 1003]
+    assert list(trades["id"]) == [0, 1, 2, 3, 4]
+    assert list(trades["side"]) == [SIDE_BUY, SIDE_BUY, SIDE_BUY, SIDE_SELL, SIDE_SELL]
+
+
+def test_ingest_without_id_counts_gap():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], limit=2, max_limit=8)
+    poller.ingest("BTC-USDT", [untagged(1001), untagged(1000)])
+    poller.ingest("BTC-USDT", [untagged(1011), untagged(1010)])
+    assert poller.gaps["BTC-USDT"] == 1
+    assert poller.limits["BTC-USDT"] == 4
+
+
+def test_limit_doubles_on_gap_and_halves_on_overlap():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], limit=4, min_limit=2, max_limit=8)
+    poller.ingest("BTC-USDT", [trade(i) for i in range(1, 5)])
+    assert poller.limits["BTC-USDT"] == 4
+    assert poller.gaps["BTC-USDT"] == 0
+
+    # Full response with no overlap: trades may have been missed.
+    poller.ingest("BTC-USDT", [trade(i) for i in range(10, 14)])
+    assert poller.limits["BTC-USDT"] == 8
+    assert poller.gaps["BTC-USDT"] == 1
+    poller.ingest("BTC-USDT", [trade(i) for i in range(20, 28)])
+    assert poller.limits["BTC-USDT"] == 8
+    assert poller.gaps["BTC-USDT"] == 2
+
+    # Mostly seen: shrink, but not below min_limit.
+    poller.ingest("BTC-USDT", [trade(i) for i in range(21, 29)])
+    assert poller.limits["BTC-USDT"] == 4
+    poller.ingest("BTC-USDT", [trade(i) for i in range(25, 29)])
+    poller.ingest("BTC-USDT", [trade(i) for i in range(25, 29)])
+    assert poller.limits["BTC-USDT"] == 2
+
+
+def test_empty_response_keeps_limit():
+    poller = TradePoller(FakeClient([]), ["BTC-USDT"], limit=4, min_limit=1)
+    assert poller.ingest("BTC-USDT", []) == 0
+    assert poller.limits["BTC-USDT"] == 4
+
+
+def test_poll_uses_tuned_limit():
+    client = FakeClient([
+        {"code": 0, "msg": "", "data": [trade(i) for i in range(1, 5)]},
+        {"code": 0, "msg": "", "data": [trade(i) for i in range(10, 14)]},
+        {"code": 0, "msg": "", "data": []},
+    ])
+    poller = TradePoller(client, ["BTC-USDT"], limit=4)
+    assert poller.poll_all() == {"BTC-USDT": 4}
+    assert poller.poll("BTC-USDT") == 4
+    assert poller.poll("BTC-USDT") == 0
+    assert client.limits == [4, 4, 8]
+    assert poller.limits["BTC-USDT"] == 8
+
+
+def test_poll_error_raises_and_keeps_limit():
+    client = FakeClient([{"code": 100001, "msg": "signature error"}])
+    poller = TradePoller(client, ["BTC-USDT"], limit=4)
+    with pytest.raises(RuntimeError, match="signature error"):
+        poller.poll("BTC-USDT")
+    assert poller.limits["BTC-USDT"] == 4
+    assert len(poller.rings["BTC-USDT"]) == 0
+
+
+def test_apoll_with_async_client():
+    client = FakeAsyncClient([
+        {"code": 0, "msg": "", "data": [trade(i) for i in range(1, 5)]},
+        {"code": 0, "msg": "", "data": [untagged(1000)]},
+    ])
+    poller = TradePoller(client, ["BTC-USDT", "ETH-USDT"], limit=4)
+    assert asyncio.run(poller.apoll_all()) == {"BTC-USDT": 4, "ETH-USDT": 1}
+    assert client.limits == [4, 4]
+
+
+def test_poll_with_async_client_raises():
+    poller = TradePoller(FakeAsyncClient([{"code": 0, "msg": "", "data": []}]), ["BTC-USDT"])
+    with pytest.raises(TypeError, match="apoll"):
+        poller.poll("BTC-USDT")